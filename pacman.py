@@ -19,18 +19,62 @@ RED = (255, 0, 0)
 GREEN = (0, 255, 0)
 ORANGE = (255, 165, 0)
 
-# Maze (1 = wall, 0 = path)
+# Maze (1 = wall, 0 = path), stored as bytes so indexing yields small ints
 MAZE = [
-    "11111111111111111111",
-    "10000000001100000001",
-    "10111111101101111101",
-    "10100000100001000001",
-    "10101111111101111001",
-    "10100010000001000001",
-    "10111110111101011101",
-    "10000000100000000001",
-    "11111111111111111111"
+    b"11111111111111111111",
+    b"10000000001100000001",
+    b"10111111101101111101",
+    b"10100000100001000001",
+    b"10101111111101111001",
+    b"10100010000001000001",
+    b"10111110111101011101",
+    b"10000000100000000001",
+    b"11111111111111111111"
 ]
+MAZE_COLS = len(MAZE[0])
+WALL = ord("1")
+PATH = ord("0")
+
+# Four entries, so a random direction is DIRS[random.getrandbits(2)]
+DIRS = ((TILE_SIZE, 0), (-TILE_SIZE, 0), (0, TILE_SIZE), (0, -TILE_SIZE))
+
+# Screen strip holding the score and lives text
+HUD_RECT = pygame.Rect(0, HEIGHT - 40, WIDTH, 40)
+
+# Player direction for each arrow key
+KEY_DIRS = {
+    pygame.K_LEFT: (-TILE_SIZE, 0),
+    pygame.K_RIGHT: (TILE_SIZE, 0),
+    pygame.K_UP: (0, -TILE_SIZE),
+    pygame.K_DOWN: (0, TILE_SIZE),
+}
+
+# Chase direction indexed by (horizontal distance dominates, target right, target below)
+CHASE_DIRS = (
+    (0, -TILE_SIZE), (0, TILE_SIZE), (0, -TILE_SIZE), (0, TILE_SIZE),
+    (-TILE_SIZE, 0), (-TILE_SIZE, 0), (TILE_SIZE, 0), (TILE_SIZE, 0),
+)
+
+def make_circle_sprite(color, size, radius):
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.circle(sprite, color, (size // 2, size // 2), radius)
+    return sprite
+
+def build_wall_bits(maze):
+    """Pack the maze into an int where bit ``row * MAZE_COLS + col`` is set for each wall tile."""
+    wall_bits = 0
+    for row_index, row in enumerate(maze):
+        for col_index, cell in enumerate(row):
+            if cell == WALL:
+                wall_bits |= 1 << (row_index * MAZE_COLS + col_index)
+    return wall_bits
+
+def hits_wall(wall_bits, x, y):
+    """Return True if a tile-sized square with its top-left at (x, y) overlaps any wall."""
+    left, right = x // TILE_SIZE, (x + TILE_SIZE - 1) // TILE_SIZE
+    top, bottom = y // TILE_SIZE, (y + TILE_SIZE - 1) // TILE_SIZE
+    row_mask = (1 << left) | (1 << right)
+    return (wall_bits & ((row_mask << top * MAZE_COLS) | (row_mask << bottom * MAZE_COLS))) != 0
 
 class Player:
     """
@@ -48,11 +92,13 @@ class Player:
     :ivar rect: The player's rectangular shape represented as a `pygame.Rect` object.
     :ivar dx: The distance the player moves horizontally per update.
     :ivar dy: The distance the player moves vertically per update.
+    :ivar image: The pre-rendered player sprite.
     """
     def __init__(self, x, y):
         self.start_x = x
         self.start_y = y
         self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+        self.image = make_circle_sprite(YELLOW, TILE_SIZE, TILE_SIZE // 2)
         self.dx = TILE_SIZE
         self.dy = 0
 
@@ -62,22 +108,12 @@ class Player:
         self.dx = TILE_SIZE
         self.dy = 0
 
-    def move(self, maze):
-        new_rect = self.rect.move(self.dx, self.dy)
-        if not self.collides_with_walls(new_rect, maze):
-            self.rect = new_rect
-
-    def collides_with_walls(self, rect, maze):
-        for row_index, row in enumerate(maze):
-            for col_index, cell in enumerate(row):
-                if cell == "1":
-                    wall_rect = pygame.Rect(col_index * TILE_SIZE, row_index * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    if rect.colliderect(wall_rect):
-                        return True
-        return False
+    def move(self, wall_bits):
+        if not hits_wall(wall_bits, self.rect.x + self.dx, self.rect.y + self.dy):
+            self.rect.move_ip(self.dx, self.dy)
 
     def draw(self, screen):
-        pygame.draw.circle(screen, YELLOW, self.rect.center, TILE_SIZE // 2)
+        screen.blit(self.image, self.rect)
 
 class Ghost:
     """
@@ -100,46 +136,41 @@ class Ghost:
     :type direction: tuple[int, int]
     :ivar color: The color of the ghost, affecting its behavior.
     :type color: tuple[int, int, int]
+    :ivar image: The pre-rendered ghost sprite in its color.
+    :type image: pygame.Surface
     """
     def __init__(self, x, y, color=RED):
         self.start_x = x
         self.start_y = y
         self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-        self.direction = random.choice([(TILE_SIZE,0), (-TILE_SIZE,0), (0,TILE_SIZE), (0,-TILE_SIZE)])
+        self.direction = DIRS[random.getrandbits(2)]
         self.color = color
+        self.image = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+        self.image.fill(color)
 
     def reset(self):
         self.rect.x = self.start_x
         self.rect.y = self.start_y
-        self.direction = random.choice([(TILE_SIZE,0), (-TILE_SIZE,0), (0,TILE_SIZE), (0,-TILE_SIZE)])
+        self.direction = DIRS[random.getrandbits(2)]
 
-    def move(self, maze, player_pos=None):
+    def move(self, wall_bits, player_pos=None):
         if self.color == RED:
-            if random.randint(0, 10) > 8:
-                self.direction = random.choice([(TILE_SIZE,0), (-TILE_SIZE,0), (0,TILE_SIZE), (0,-TILE_SIZE)])
+            # 3/16 chance per move, close to the original randint(0, 10) > 8 (2/11)
+            if random.getrandbits(4) < 3:
+                self.direction = DIRS[random.getrandbits(2)]
         elif self.color == ORANGE and player_pos:
             px, py = player_pos
             gx, gy = self.rect.x, self.rect.y
-            if abs(px - gx) > abs(py - gy):
-                self.direction = (TILE_SIZE if px > gx else -TILE_SIZE, 0)
-            else:
-                self.direction = (0, TILE_SIZE if py > gy else -TILE_SIZE)
+            index = ((abs(px - gx) > abs(py - gy)) << 2) | ((px > gx) << 1) | (py > gy)
+            self.direction = CHASE_DIRS[index]
 
-        new_rect = self.rect.move(*self.direction)
-        if not self.collides_with_walls(new_rect, maze):
-            self.rect = new_rect
-
-    def collides_with_walls(self, rect, maze):
-        for row_index, row in enumerate(maze):
-            for col_index, cell in enumerate(row):
-                if cell == "1":
-                    wall_rect = pygame.Rect(col_index * TILE_SIZE, row_index * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                    if rect.colliderect(wall_rect):
-                        return True
-        return False
+        dx, dy = self.direction
+        if not hits_wall(wall_bits, self.rect.x + dx, self.rect.y + dy):
+            # Move in place so Game.ghost_rects keeps referring to this rect
+            self.rect.move_ip(dx, dy)
 
     def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect)
+        screen.blit(self.image, self.rect)
 
 class Dot:
     """
@@ -153,14 +184,20 @@ class Dot:
     :type rect: pygame.Rect
     :ivar eaten: Indicates whether the dot has been consumed.
     :type eaten: bool
+    :cvar image: The pre-rendered sprite shared by every dot.
+    :type image: pygame.Surface
     """
+    image = None
+
     def __init__(self, x, y):
         self.rect = pygame.Rect(x + TILE_SIZE//4, y + TILE_SIZE//4, TILE_SIZE//2, TILE_SIZE//2)
         self.eaten = False
+        if Dot.image is None:
+            Dot.image = make_circle_sprite(GREEN, TILE_SIZE//2, 4)
 
     def draw(self, screen):
         if not self.eaten:
-            pygame.draw.circle(screen, GREEN, self.rect.center, 4)
+            screen.blit(self.image, self.rect)
 
 class Game:
     """
@@ -176,13 +213,21 @@ class Game:
     :ivar clock: Controls the frame rate of the game.
     :type clock: pygame.time.Clock
     :ivar maze: The layout of the game maze, defined as a 2D list.
-    :type maze: list[list[str]]
+    :type maze: list[bytes]
+    :ivar wall_bits: The maze's wall tiles packed once into a bitmask, used
+        for collision checks.
+    :type wall_bits: int
+    :ivar background: The static maze walls, rendered once and blitted each frame.
+    :type background: pygame.Surface
     :ivar player: The player character in the game (Pacman).
     :type player: Player
     :ivar ghosts: A list of ghost characters in the game.
     :type ghosts: list[Ghost]
-    :ivar dots: A collection of all dots present in the maze.
-    :type dots: list[Dot]
+    :ivar ghost_rects: The ghosts' rects, shared by reference, for batched
+        collision tests.
+    :type ghost_rects: list[pygame.Rect]
+    :ivar dot_map: The uneaten dots, keyed by their (column, row) tile.
+    :type dot_map: dict[tuple[int, int], Dot]
     :ivar score: The current game score.
     :type score: int
     :ivar font: The font used to render text on the screen.
@@ -191,107 +236,183 @@ class Game:
     :type game_over: bool
     :ivar lives: The number of lives remaining for the player.
     :type lives: int
+    :ivar dirty: Screen areas that changed this frame and must be pushed to
+        the display.
+    :type dirty: list[pygame.Rect]
+    :ivar full_redraw: Whether the next frame repaints and flips the whole
+        screen instead of only the dirty areas.
+    :type full_redraw: bool
     """
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        try:
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF | pygame.SCALED, vsync=1)
+        except pygame.error:
+            # Some drivers cannot provide a vsynced renderer; fall back to an unsynced one
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF | pygame.SCALED)
         pygame.display.set_caption("Pacman")
+        # Keep mouse motion and other unused events out of the queue drained each frame
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE])
         self.clock = pygame.time.Clock()
         self.maze = MAZE
+        self.wall_bits = build_wall_bits(self.maze)
+        self.background = self.create_background()
         self.player = Player(1 * TILE_SIZE, 1 * TILE_SIZE)
         self.ghosts = [Ghost(10 * TILE_SIZE, 1 * TILE_SIZE, RED), Ghost(10 * TILE_SIZE, 5 * TILE_SIZE, ORANGE)]
-        self.dots = self.create_dots()
-        self.score = 0
+        self.ghost_rects = [ghost.rect for ghost in self.ghosts]
         self.font = pygame.font.SysFont(None, 36)
+        self._text_cache = {}
+        self._hud_drawn = None
+        self.over_text = self.render_text("Game Over - Press R to Restart", RED)
+        self.over_rect = self.over_text.get_rect(topleft=(WIDTH//2 - 200, HEIGHT//2))
+        self.dirty = []
+        self.reset_game()
+
+    def reset_game(self):
+        # Only per-round state is rebuilt; the display, font and cached surfaces are kept
+        self.reset_positions()
+        self.dot_map = self.create_dots()
+        self.score = 0
         self.game_over = False
         self.lives = 3
+        self.dirty.clear()
+        self.full_redraw = True
 
     def reset_positions(self):
         self.player.reset()
         for ghost in self.ghosts:
             ghost.reset()
 
-    def create_dots(self) -> list[Dot]:
+    def create_dots(self) -> dict[tuple[int, int], Dot]:
 
-        dots = []
+        dots = {}
         for row_index, row in enumerate(self.maze):
             for col_index, cell in enumerate(row):
-                if cell == "0":
-                    dots.append(Dot(col_index * TILE_SIZE, row_index * TILE_SIZE))
+                if cell == PATH:
+                    dots[(col_index, row_index)] = Dot(col_index * TILE_SIZE, row_index * TILE_SIZE)
         return dots
 
-    def draw_maze(self):
+    def create_background(self) -> pygame.Surface:
+        background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        background.fill(BLACK)
         for row_index, row in enumerate(self.maze):
             for col_index, cell in enumerate(row):
-                if cell == "1":
+                if cell == WALL:
                     pygame.draw.rect(
-                        self.screen,
+                        background,
                         BLUE,
                         pygame.Rect(col_index * TILE_SIZE, row_index * TILE_SIZE, TILE_SIZE, TILE_SIZE)
                     )
-
-    def handle_events(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.player.dx, self.player.dy = -TILE_SIZE, 0
-        elif keys[pygame.K_RIGHT]:
-            self.player.dx, self.player.dy = TILE_SIZE, 0
-        elif keys[pygame.K_UP]:
-            self.player.dx, self.player.dy = 0, -TILE_SIZE
-        elif keys[pygame.K_DOWN]:
-            self.player.dx, self.player.dy = 0, TILE_SIZE
-        if self.game_over and keys[pygame.K_r]:
-            self.__init__()
+        return background
 
     def update_dots(self):
-        for dot in self.dots:
-            if not dot.eaten and self.player.rect.colliderect(dot.rect):
-                dot.eaten = True
-                self.score += 10
+        # The player is tile-aligned, so its top-left tile is the only one it can be eating from
+        tile = (self.player.rect.x // TILE_SIZE, self.player.rect.y // TILE_SIZE)
+        dot = self.dot_map.pop(tile, None)
+        if dot:
+            dot.eaten = True
+            self.score += 10
+            self.dirty.append(dot.rect)
 
     def check_collisions(self):
-        for ghost in self.ghosts:
-            if self.player.rect.colliderect(ghost.rect):
-                self.lives -= 1
-                if self.lives <= 0:
-                    self.game_over = True
-                else:
-                    self.reset_positions()
+        # Test all ghosts in one pass so a frame costs at most one life
+        if self.player.rect.collidelist(self.ghost_rects) != -1:
+            self.lives -= 1
+            if self.lives <= 0:
+                self.game_over = True
+            else:
+                self.reset_positions()
+
+    def render_text(self, text, color):
+        # Each distinct string is rasterized once; later frames and restarts reuse the surface
+        key = (text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
 
     def draw_score(self):
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
-        self.screen.blit(score_text, (10, HEIGHT - 40))
-        self.screen.blit(lives_text, (200, HEIGHT - 40))
+        # The HUD strip is only repainted and pushed when a value on it changes
+        hud = (self.score, self.lives)
+        if self.full_redraw or hud != self._hud_drawn:
+            self.screen.blit(self.background, HUD_RECT, HUD_RECT)
+            self.screen.blit(self.render_text(f"Score: {self.score}", WHITE), (10, HEIGHT - 40))
+            self.screen.blit(self.render_text(f"Lives: {self.lives}", WHITE), (200, HEIGHT - 40))
+            self.dirty.append(HUD_RECT)
+            self._hud_drawn = hud
         if self.game_over:
-            over_text = self.font.render("Game Over - Press R to Restart", True, RED)
-            self.screen.blit(over_text, (WIDTH//2 - 200, HEIGHT//2))
+            self.screen.blit(self.background, self.over_rect, self.over_rect)
+            self.screen.blit(self.over_text, self.over_rect)
+            self.dirty.append(self.over_rect)
+
+    def restore_tile(self, rect):
+        # Dirty rects are tile-aligned entities or eaten dots, so each covers one tile with at most one dot
+        self.screen.blit(self.background, rect, rect)
+        dot = self.dot_map.get((rect.x // TILE_SIZE, rect.y // TILE_SIZE))
+        if dot:
+            dot.draw(self.screen)
+
+    def update(self):
+        if self.game_over:
+            return
+        self.dirty.append(self.player.rect.copy())
+        self.dirty.extend(rect.copy() for rect in self.ghost_rects)
+        self.player.move(self.wall_bits)
+        self.update_dots()
+        player_pos = self.player.rect.center
+        for ghost in self.ghosts:
+            ghost.move(self.wall_bits, player_pos)
+        self.check_collisions()
+
+    def draw(self):
+        # After the game-over frame nothing moves, so the screen already shows the right picture
+        if self.game_over and not self.dirty and not self.full_redraw:
+            return
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            self.screen.blits([(dot.image, dot.rect) for dot in self.dot_map.values()], False)
+        else:
+            for rect in self.dirty:
+                self.restore_tile(rect)
+        self.player.draw(self.screen)
+        for ghost in self.ghosts:
+            ghost.draw(self.screen)
+        self.dirty.append(self.player.rect)
+        self.dirty.extend(self.ghost_rects)
+        self.draw_score()
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.dirty)
+        self.dirty.clear()
+
+    def handle_events(self, events):
+        for event in events:
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                direction = KEY_DIRS.get(event.key)
+                if direction:
+                    self.player.dx, self.player.dy = direction
+                elif self.game_over and event.key == pygame.K_r:
+                    self.reset_game()
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Only dirty areas are normally pushed, so repaint everything the window lost
+                self.full_redraw = True
 
     def run(self):
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-
-            self.handle_events()
-
-            if not self.game_over:
-                self.player.move(self.maze)
-                self.update_dots()
-                for ghost in self.ghosts:
-                    ghost.move(self.maze, self.player.rect.center)
-                self.check_collisions()
-
-            self.screen.fill(BLACK)
-            self.draw_maze()
-            for dot in self.dots:
-                dot.draw(self.screen)
-            self.player.draw(self.screen)
-            for ghost in self.ghosts:
-                ghost.draw(self.screen)
-            self.draw_score()
-            pygame.display.flip()
+            if self.game_over:
+                # Nothing animates on the game-over screen, so sleep until the next event
+                self.handle_events([pygame.event.wait()])
+            else:
+                self.handle_events(pygame.event.get())
+            self.update()
+            self.draw()
             self.clock.tick(FPS)
 
 if __name__ == '__main__':